@@ -3,9 +3,9 @@ from fastapi import FastAPI
 app = FastAPI()
 
 @app.get("/")
-def home():
+async def home():
     return {"message": "Deployment works!"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}